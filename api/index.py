@@ -5,8 +5,11 @@ Vercel's @vercel/python runtime imports this file and serves the
 `app` ASGI application. All requests are routed here by vercel.json.
 
 The backend directory is added to sys.path at module level so that
-`from main import app` works. The bot directory is added lazily by
-the webhook handler when it first processes a Telegram update.
+`from main import app` works. The FastAPI app itself is imported on the
+first ASGI call rather than at module import, keeping FastAPI, SQLAlchemy
+and the route modules off the cold-start import path. The bot directory
+is added lazily by the webhook handler when it first processes a
+Telegram update.
 
 Note: bot/config.py was renamed to bot/bot_config.py to avoid module
 name conflicts with backend/config.py when both dirs are on sys.path.
@@ -22,5 +25,14 @@ _backend_dir = os.path.join(_root, "backend")
 if _backend_dir not in sys.path:
     sys.path.insert(0, _backend_dir)
 
-# Import the FastAPI app — Vercel looks for `app` at module level
-from main import app  # noqa: E402
+# Vercel looks for `app` at module level. This thin ASGI shim defers the
+# real FastAPI import until the first request (or lifespan event) arrives.
+_app = None
+
+
+async def app(scope, receive, send):
+    global _app
+    if _app is None:
+        from main import app as _real_app
+        _app = _real_app
+    await _app(scope, receive, send)
@@ -7,6 +7,8 @@ DATABASE_URL priority:
   2. Fallback: SQLite for local development
 """
 
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -20,7 +22,7 @@ class Settings(BaseSettings):
     # Database — Neon PostgreSQL (REQUIRED, no SQLite fallback on Vercel)
     DATABASE_URL: str = ""
 
-    @property
+    @cached_property
     def is_postgres(self) -> bool:
         """True when using PostgreSQL (always True on Vercel)."""
         return self.DATABASE_URL.startswith("postgresql")
@@ -49,8 +51,9 @@ class Settings(BaseSettings):
     ENABLE_TELEGRAM_BOT: bool = False
     ENABLE_WHATSAPP: bool = False
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
+        """CORS_ORIGINS split once on first access (settings are static)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     model_config = {
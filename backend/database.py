@@ -3,10 +3,17 @@ Database setup using SQLAlchemy — PostgreSQL only (Neon DB).
 
 This is the Vercel serverless version. No SQLite support.
 Connection pooling is tuned for short-lived serverless functions.
+
+The engine is built on first use (not at import time) so cold starts that
+never touch the database skip pool construction entirely.
 """
 
 import logging
+import os
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker, declarative_base
 from config import settings
 
@@ -22,24 +29,69 @@ if not settings.DATABASE_URL or settings.DATABASE_URL.startswith("sqlite"):
         "Set it in Vercel environment variables."
     )
 
-logger.info("Using PostgreSQL backend (Neon DB)")
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,       # Auto-reconnect stale connections
-    pool_size=3,              # Lower for serverless (short-lived functions)
-    max_overflow=5,
-    pool_timeout=10,
-    pool_recycle=120,         # Shorter recycle for serverless
-    echo=settings.DEBUG,
-)
+def _driver_url(url: str) -> str:
+    """Point postgres URLs at the psycopg (v3) SQLAlchemy dialect.
+
+    Explicit psycopg2 URLs are rewritten too: psycopg2 is no longer installed.
+    """
+    for prefix in ("postgresql://", "postgres://", "postgresql+psycopg2://"):
+        if url.startswith(prefix):
+            return "postgresql+psycopg://" + url[len(prefix):]
+    return url
+
+
+def _pool_options() -> dict:
+    """Pool settings for the current runtime.
+
+    On Vercel each function instance serves one request at a time and Neon's
+    PgBouncer already pools server-side, so a client-side pool only holds
+    idle connections against Neon's limit. Elsewhere keep a minimal pool.
+    """
+    if os.getenv("VERCEL"):
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": 1,           # One request per instance at a time
+        "max_overflow": 1,
+        "pool_timeout": 10,
+        "pool_recycle": 60,       # Shorter recycle for serverless
+    }
+
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Return the process-wide engine, creating it on first call."""
+    logger.info("Using PostgreSQL backend (Neon DB)")
+    return create_engine(
+        _driver_url(settings.DATABASE_URL),
+        # psycopg3's default prepare_threshold (5) prepares repeated statements
+        # server-side; Neon's PgBouncer supports these protocol-level prepared
+        # statements. SQLAlchemy's compiled cache keeps its default size.
+        pool_pre_ping=True,       # Auto-reconnect stale connections
+        echo=settings.DEBUG,
+        **_pool_options(),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_sessionmaker():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def SessionLocal():
+    """Create a new database session bound to the lazily-built engine."""
+    return _get_sessionmaker()()
+
 
 Base = declarative_base()
 
 
+def warmup():
+    """Build the engine and open one pooled connection ahead of traffic."""
+    with get_engine().connect():
+        pass
+
+
 def get_db():
     """Dependency that provides a database session."""
     db = SessionLocal()
@@ -58,5 +110,5 @@ def init_db():
         ReasonTaxonomy, FeedbackTicket, DepartmentQueue, AggregationAlert,
         TicketMessage, BotState,
     )
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     logger.info("Database tables created / verified.")
@@ -13,18 +13,12 @@ Modules:
     playbook_engine     — Condition evaluator + default playbook definitions
     adm_intelligence    — ADM effectiveness, priority ranking, briefings
     whatsapp_templates  — Bilingual (Hindi + English) message templates
+
+Submodules are imported lazily; set ADM_EAGER_IMPORT=1 to load eagerly.
 """
 
-from domain.enums import (
-    AgentLifecycleState,
-    DormancyReasonCategory,
-    DormancyReasonCode,
-    ContactOutcome,
-    SentimentLabel,
-    ChannelType,
-    TrainingTopic,
-    ProductCategory,
-)
+import importlib
+import os
 
 __all__ = [
     "AgentLifecycleState",
@@ -36,3 +30,27 @@ __all__ = [
     "TrainingTopic",
     "ProductCategory",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve the re-exported enums lazily (PEP 562).
+
+    Keeps `import domain` cheap on serverless cold starts; the enum module
+    is only loaded the first time one of its names is accessed, after which
+    the attribute is cached on this module.
+    """
+    if name in __all__:
+        value = getattr(importlib.import_module("domain.enums"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# Escape hatch for tests / long-running workers that prefer import-time errors
+if os.environ.get("ADM_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
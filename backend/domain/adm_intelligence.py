@@ -13,33 +13,150 @@ Provides:
 """
 from __future__ import annotations
 
+import heapq
 import logging
+import os
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Sequence
 
-from domain.enums import AgentLifecycleState, DormancyReasonCategory
-from domain.dormancy_taxonomy import get_reason_by_code, _CATEGORY_NAMES_HI
+from domain.enums import AgentLifecycleState
+
+# The dormancy taxonomy is a large literal only needed by the DORMANT paths,
+# so it is imported inside the dormant-only branches that use it (faster
+# cold starts; nothing else pays for it).
+if os.environ.get("ADM_EAGER_IMPORT") == "1":
+    import domain.dormancy_taxonomy  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
 MAX_PRIORITY_AGENTS = 5
 
+# Sort rank for PriorityAgent.urgency (lower sorts first)
+_URGENCY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2}
+
+# Lifecycle states bound once at import for the per-agent loops. Agent dicts
+# carry plain strings (from the DB / JSON), so bind the enum *values*: str
+# == str comparisons and hashes skip the enum subclass entirely.
+_ONBOARDED = AgentLifecycleState.ONBOARDED.value
+_LICENSED = AgentLifecycleState.LICENSED.value
+_AT_RISK = AgentLifecycleState.AT_RISK.value
+_DORMANT = AgentLifecycleState.DORMANT.value
+
+# Small-int codes for the states that drive priority scoring. Each agent's
+# state string is hashed once per loop iteration; the branches compare ints.
+_AT_RISK_CODE, _DORMANT_CODE, _ONBOARDED_CODE = 1, 2, 3
+_SCORED_STATE_CODES = {
+    _AT_RISK: _AT_RISK_CODE,
+    _DORMANT: _DORMANT_CODE,
+    _ONBOARDED: _ONBOARDED_CODE,
+}
+
+# States that never get the low-engagement penalty
+_ENGAGEMENT_EXEMPT = frozenset((
+    _ONBOARDED,
+    AgentLifecycleState.TERMINATED.value,
+    AgentLifecycleState.LAPSED.value,
+))
+
+# Lifecycle states that count as "activated" (reached a first sale or beyond)
+_ACTIVATED = frozenset((
+    AgentLifecycleState.FIRST_SALE.value,
+    AgentLifecycleState.ACTIVE.value,
+    AgentLifecycleState.PRODUCTIVE.value,
+))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date | None:
+    """Parse a YYYY-MM-DD string, None if malformed.
+
+    Zero-padded dates take the C-level fromisoformat fast path. Anything
+    else goes through strptime("%Y-%m-%d"), whose rules this has always
+    followed: "2024-1-5" parses, "20240105" (which fromisoformat would
+    accept) does not.
+    """
+    if (
+        len(value) == 10
+        and value.isascii()
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _day_ordinal(value: date | str | None) -> int | None:
+    """Normalize a date field (date, ISO string or empty) to a day ordinal."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = _parse_date(value)
+        if value is None:
+            return None
+    return value.toordinal()
+
 
 # ===========================================================================
 # PART 1: ADM Effectiveness Classification (4 Tiers)
 # ===========================================================================
 
-@dataclass
+# Static recommendations per tier — shared, never rebuilt per call
+_RECS_UNRESPONSIVE: tuple[str, ...] = (
+    "ADM is not responding to system nudges — consider a direct manager conversation",
+    "Check if ADM is receiving notifications properly",
+    "Schedule a 1-on-1 to understand blockers",
+    "Consider reassigning high-priority agents temporarily",
+)
+_RECS_HIGH_PERFORMER: tuple[str, ...] = (
+    "Recognize this ADM for excellent performance",
+    "Consider them for mentoring struggling ADMs",
+    "Share their best practices with the team",
+)
+_RECS_AVERAGE: tuple[str, ...] = (
+    "Focus on converting at-risk agents before they go dormant",
+    "Increase frequency of agent check-ins",
+    "Review and learn from high-performer strategies",
+)
+_RECS_STRUGGLING: tuple[str, ...] = (
+    "Provide coaching on effective agent conversations",
+    "Pair with a high-performing ADM for mentoring",
+    "Review approach with dormant agents — may need different strategy",
+    "Consider focused training on reactivation techniques",
+)
+_RECS_BELOW_AVERAGE: tuple[str, ...] = (
+    "Increase agent touchpoints",
+    "Respond to system nudges more promptly",
+    "Focus on understanding agent blockers",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ADMEffectivenessResult:
-    """Result of ADM effectiveness evaluation."""
+    """Result of ADM effectiveness evaluation.
+
+    `recommendations` is a shared read-only tuple; copy it before mutating.
+    """
     classification: str  # HIGH_PERFORMER | AVERAGE | STRUGGLING | UNRESPONSIVE
     reason: str
     activation_rate: float
     nudge_response_rate: float
     portfolio_size: int
     agents_by_state: dict[str, int] = field(default_factory=dict)
-    recommendations: list[str] = field(default_factory=list)
+    recommendations: Sequence[str] = ()
 
 
 def classify_adm_effectiveness(
@@ -66,51 +183,28 @@ def classify_adm_effectiveness(
         ADMEffectivenessResult with classification, reason, and recommendations.
     """
     agents_by_state = agents_by_state or {}
-    recommendations = []
 
     # Classify
     if nudge_response_rate < 0.2:
         classification = "UNRESPONSIVE"
         reason = "Nudge response rate below 20%"
-        recommendations = [
-            "ADM is not responding to system nudges — consider a direct manager conversation",
-            "Check if ADM is receiving notifications properly",
-            "Schedule a 1-on-1 to understand blockers",
-            "Consider reassigning high-priority agents temporarily",
-        ]
+        recommendations = _RECS_UNRESPONSIVE
     elif activation_rate > 0.10 and nudge_response_rate > 0.7:
         classification = "HIGH_PERFORMER"
         reason = "Strong activation rate with excellent nudge responsiveness"
-        recommendations = [
-            "Recognize this ADM for excellent performance",
-            "Consider them for mentoring struggling ADMs",
-            "Share their best practices with the team",
-        ]
+        recommendations = _RECS_HIGH_PERFORMER
     elif activation_rate >= 0.03:
         classification = "AVERAGE"
         reason = "Moderate activation rate — room for improvement"
-        recommendations = [
-            "Focus on converting at-risk agents before they go dormant",
-            "Increase frequency of agent check-ins",
-            "Review and learn from high-performer strategies",
-        ]
+        recommendations = _RECS_AVERAGE
     elif nudge_response_rate > 0.3:
         classification = "STRUGGLING"
         reason = "Low activation rate but responsive to nudges — needs support"
-        recommendations = [
-            "Provide coaching on effective agent conversations",
-            "Pair with a high-performing ADM for mentoring",
-            "Review approach with dormant agents — may need different strategy",
-            "Consider focused training on reactivation techniques",
-        ]
+        recommendations = _RECS_STRUGGLING
     else:
         classification = "AVERAGE"
         reason = "Below-average activation — focus on agent engagement"
-        recommendations = [
-            "Increase agent touchpoints",
-            "Respond to system nudges more promptly",
-            "Focus on understanding agent blockers",
-        ]
+        recommendations = _RECS_BELOW_AVERAGE
 
     return ADMEffectivenessResult(
         classification=classification,
@@ -131,14 +225,9 @@ def compute_activation_rate(agents: list[dict]) -> float:
     """
     if not agents:
         return 0.0
-    activated_states = {
-        AgentLifecycleState.FIRST_SALE,
-        AgentLifecycleState.ACTIVE,
-        AgentLifecycleState.PRODUCTIVE,
-    }
     activated = sum(
         1 for a in agents
-        if a.get("lifecycle_state") in activated_states
+        if a.get("lifecycle_state") in _ACTIVATED
     )
     return activated / len(agents)
 
@@ -147,7 +236,7 @@ def compute_activation_rate(agents: list[dict]) -> float:
 # PART 2: Priority Agent Ranking Algorithm
 # ===========================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PriorityAgent:
     """An agent flagged for priority attention by the ADM."""
     agent_id: int
@@ -163,6 +252,7 @@ class PriorityAgent:
 def rank_priority_agents(
     agents: list[dict],
     max_results: int = MAX_PRIORITY_AGENTS,
+    today: date | None = None,
 ) -> list[PriorityAgent]:
     """Rank agents by priority for ADM attention.
 
@@ -180,12 +270,16 @@ def rank_priority_agents(
                 dormancy_reason, dormancy_duration_days, engagement_score,
                 last_contact_date, date_of_joining, etc.
         max_results: Maximum number of priority agents to return.
+        today: Reference date (defaults to date.today()). Batch jobs should
+               compute it once and pass it to every call.
 
     Returns:
         Sorted list of PriorityAgent objects (highest priority first).
     """
-    scored: list[PriorityAgent] = []
-    today = date.today()
+    # Score every agent first; PriorityAgent objects (and their joined context
+    # strings) are only materialized for the rows that make the top-k cut.
+    scored: list[tuple] = []
+    today_ordinal = (today or date.today()).toordinal()
 
     for agent in agents:
         score = 0.0
@@ -193,111 +287,105 @@ def rank_priority_agents(
         action = "Check in with the agent"
         urgency = "MEDIUM"
         state = agent.get("lifecycle_state", "")
+        state_code = _SCORED_STATE_CODES.get(state, 0)
+
+        # Date fields arrive as date objects or ISO strings; normalize them
+        # to day ordinals once so the scoring below is plain int arithmetic.
+        expiry_ord = _day_ordinal(agent.get("license_expiry_date"))
+        contact_ord = _day_ordinal(agent.get("last_contact_date"))
 
         # License expiry urgency
-        license_expiry = agent.get("license_expiry_date")
-        if license_expiry:
-            if isinstance(license_expiry, str):
-                try:
-                    license_expiry = datetime.strptime(license_expiry, "%Y-%m-%d").date()
-                except ValueError:
-                    license_expiry = None
-            if license_expiry:
-                days_to_expiry = (license_expiry - today).days
-                if 0 < days_to_expiry <= 45:
-                    score += 100
-                    context_parts.append(f"License expiring in {days_to_expiry} days")
-                    action = "Help complete training hours for renewal"
-                    urgency = "CRITICAL"
-                elif days_to_expiry <= 0:
-                    score += 90
-                    context_parts.append("License EXPIRED")
-                    action = "Urgent: help with license renewal"
-                    urgency = "CRITICAL"
+        if expiry_ord is not None:
+            days_to_expiry = expiry_ord - today_ordinal
+            if 0 < days_to_expiry <= 45:
+                score += 100
+                context_parts.append(f"License expiring in {days_to_expiry} days")
+                action = "Help complete training hours for renewal"
+                urgency = "CRITICAL"
+            elif days_to_expiry <= 0:
+                score += 90
+                context_parts.append("License EXPIRED")
+                action = "Urgent: help with license renewal"
+                urgency = "CRITICAL"
 
         # State-based scoring
-        if state == AgentLifecycleState.AT_RISK:
+        if state_code == _AT_RISK_CODE:
             score += 80
             days_in_state = agent.get("days_in_state", 0)
             context_parts.append(f"At-risk for {days_in_state} days")
             action = "Call to understand what is happening and prevent dormancy"
             urgency = "HIGH"
 
-        elif state == AgentLifecycleState.DORMANT:
+        elif state_code == _DORMANT_CODE:
             score += 60
             dormancy_days = agent.get("dormancy_duration_days", 0)
             context_parts.append(f"Dormant for {dormancy_days} days")
             reason = agent.get("dormancy_reason", "")
             if reason:
+                from domain.dormancy_taxonomy import get_reason_by_code
+
                 reason_info = get_reason_by_code(reason)
                 if reason_info:
-                    action = reason_info.get("suggested_action_en", "Reach out to understand the situation")
+                    action = reason_info["suggested_action_en"]
                 else:
                     action = "Reach out to understand what is happening"
             else:
                 action = "Find out why they are inactive"
             urgency = "HIGH"
 
-        elif state == AgentLifecycleState.ONBOARDED:
-            doj = agent.get("date_of_joining")
-            if doj:
-                if isinstance(doj, str):
-                    try:
-                        doj = datetime.strptime(doj, "%Y-%m-%d").date()
-                    except ValueError:
-                        doj = None
-                if doj:
-                    days_since = (today - doj).days
-                    if days_since > 7:
-                        score += 40
-                        context_parts.append(f"Onboarded {days_since} days ago, needs first contact")
-                        action = "Make first contact — critical for retention"
-                        urgency = "HIGH"
+        elif state_code == _ONBOARDED_CODE:
+            doj_ord = _day_ordinal(agent.get("date_of_joining"))
+            if doj_ord is not None:
+                days_since = today_ordinal - doj_ord
+                if days_since > 7:
+                    score += 40
+                    context_parts.append(f"Onboarded {days_since} days ago, needs first contact")
+                    action = "Make first contact — critical for retention"
+                    urgency = "HIGH"
 
         # No recent contact penalty
-        last_contact = agent.get("last_contact_date")
-        if last_contact:
-            if isinstance(last_contact, str):
-                try:
-                    last_contact = datetime.strptime(last_contact, "%Y-%m-%d").date()
-                except ValueError:
-                    last_contact = None
-            if last_contact:
-                days_since_contact = (today - last_contact).days
-                if days_since_contact > 30:
-                    score += 30
-                    context_parts.append(f"No contact in {days_since_contact} days")
+        if contact_ord is not None:
+            days_since_contact = today_ordinal - contact_ord
+            if days_since_contact > 30:
+                score += 30
+                context_parts.append(f"No contact in {days_since_contact} days")
 
         # Low engagement penalty
         engagement = agent.get("engagement_score", 0.0)
-        if engagement < 20 and state not in ("onboarded", "terminated", "lapsed"):
+        if engagement < 20 and state not in _ENGAGEMENT_EXEMPT:
             score += 20
             context_parts.append(f"Very low engagement ({engagement:.0f}%)")
 
         if score > 0:
-            scored.append(PriorityAgent(
-                agent_id=agent.get("id", 0),
-                agent_name=agent.get("name", "Unknown"),
-                lifecycle_state=state,
-                priority_score=score,
-                one_line_context=" | ".join(context_parts) if context_parts else "Needs attention",
-                suggested_action=action,
-                urgency=urgency,
-                dormancy_reason=agent.get("dormancy_reason"),
+            scored.append((
+                -score, _URGENCY_RANK[urgency],
+                score, urgency, agent, state, context_parts, action,
             ))
 
-    # Sort by priority score (descending), then by urgency
-    urgency_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2}
-    scored.sort(key=lambda p: (-p.priority_score, urgency_order.get(p.urgency, 3)))
-
-    return scored[:max_results]
+    # Top-k by priority score (descending), then by urgency. nsmallest is
+    # O(N log k) and, like sorted()[:k], keeps portfolio order on ties.
+    top = heapq.nsmallest(max_results, scored, key=itemgetter(0, 1))
+
+    return [
+        PriorityAgent(
+            agent_id=agent.get("id", 0),
+            agent_name=agent.get("name", "Unknown"),
+            lifecycle_state=state,
+            priority_score=score,
+            one_line_context=" | ".join(context_parts) if context_parts else "Needs attention",
+            suggested_action=action,
+            urgency=urgency,
+            dormancy_reason=agent.get("dormancy_reason"),
+        )
+        for _, _, score, urgency, agent, state, context_parts, action in top
+    ]
 
 
 # ===========================================================================
 # PART 3: Morning Briefing Content Generation
 # ===========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MorningBriefing:
     """Content for an ADM's morning briefing."""
     date: date
@@ -310,6 +398,60 @@ class MorningBriefing:
     formatted_text_hi: str  # Hindi version
 
 
+_BRIEFING_LABELS_EN = {
+    "greeting": "Good morning, {adm_name}!",
+    "date_label": "Date",
+    "portfolio_header": "--- Your Portfolio ---",
+    "new_label": "New (onboarded)",
+    "priority_header": "--- Priority Agents Today ---",
+    "wins_header": "--- Celebrations ---",
+    "items_header": "--- Today's Action Items ---",
+}
+
+_BRIEFING_LABELS_HI = {
+    "greeting": "Suprabhat, {adm_name} ji!",
+    "date_label": "Tarikh",
+    "portfolio_header": "--- Aapka Portfolio ---",
+    "new_label": "Naye (onboarded)",
+    "priority_header": "--- Aaj ke Priority Agents ---",
+    "wins_header": "--- Badhai! ---",
+    "items_header": "--- Aaj ke Kaam ---",
+}
+
+_BRIEFING_TEMPLATE = (
+    "{greeting}\n"
+    "{date_label}: {date}\n"
+    "\n"
+    "{portfolio_header}\n"
+    "{portfolio}"
+    "{new_label}: {onboarded}\n"
+    "\n"
+    "{priority}"
+    "{wins}"
+    "{items_header}\n"
+    "{items}"
+)
+
+
+@lru_cache(maxsize=32)
+def _format_briefing_date(briefing_date: date) -> str:
+    """Date line value; identical for every ADM in a daily batch."""
+    return briefing_date.strftime("%d %b %Y")
+
+
+def _render_briefing(labels: dict[str, str], adm_name: str, sections: dict) -> str:
+    """Fill the briefing template with one language's labels."""
+    priority_rows = sections["priority_rows"]
+    win_rows = sections["win_rows"]
+    return _BRIEFING_TEMPLATE.format_map({
+        **labels,
+        **sections,
+        "greeting": labels["greeting"].format(adm_name=adm_name),
+        "priority": f"{labels['priority_header']}\n{priority_rows}\n" if priority_rows else "",
+        "wins": f"{labels['wins_header']}\n{win_rows}\n" if win_rows else "",
+    })
+
+
 def generate_morning_briefing(
     adm_name: str,
     agents: list[dict],
@@ -322,7 +464,9 @@ def generate_morning_briefing(
         adm_name: The ADM's name for personalization.
         agents: List of agent dicts assigned to this ADM.
         recent_wins: Recent positive events [{agent_name, achievement}].
-        briefing_date: Date for the briefing (defaults to today).
+        briefing_date: Date for the briefing (defaults to today). Also used
+                       as the reference date for priority ranking, so batch
+                       jobs can compute it once for every ADM.
 
     Returns:
         MorningBriefing with all content populated.
@@ -330,15 +474,14 @@ def generate_morning_briefing(
     briefing_date = briefing_date or date.today()
     recent_wins = recent_wins or []
 
-    # Compute snapshot
+    # Compute snapshot (single pass over the portfolio)
     total = len(agents)
-    active = sum(1 for a in agents if a.get("lifecycle_state") in (
-        AgentLifecycleState.ACTIVE, AgentLifecycleState.PRODUCTIVE, AgentLifecycleState.FIRST_SALE
-    ))
-    at_risk = sum(1 for a in agents if a.get("lifecycle_state") == AgentLifecycleState.AT_RISK)
-    dormant = sum(1 for a in agents if a.get("lifecycle_state") == AgentLifecycleState.DORMANT)
-    onboarded = sum(1 for a in agents if a.get("lifecycle_state") == AgentLifecycleState.ONBOARDED)
-    licensed = sum(1 for a in agents if a.get("lifecycle_state") == AgentLifecycleState.LICENSED)
+    state_counts = Counter(a.get("lifecycle_state") for a in agents)
+    active = sum(state_counts[s] for s in _ACTIVATED)
+    at_risk = state_counts[_AT_RISK]
+    dormant = state_counts[_DORMANT]
+    onboarded = state_counts[_ONBOARDED]
+    licensed = state_counts[_LICENSED]
 
     snapshot = {
         "total": total,
@@ -350,7 +493,7 @@ def generate_morning_briefing(
     }
 
     # Priority agents
-    priority_agents = rank_priority_agents(agents)
+    priority_agents = rank_priority_agents(agents, today=briefing_date)
 
     # Action items
     action_items = []
@@ -366,75 +509,33 @@ def generate_morning_briefing(
     for pa in priority_agents[:3]:
         action_items.append(f"{pa.agent_name}: {pa.suggested_action}")
 
-    # Format English text
-    greeting = f"Good morning, {adm_name}!"
-
-    lines_en = [
-        f"Good morning, {adm_name}!",
-        f"Date: {briefing_date.strftime('%d %b %Y')}",
-        "",
-        "--- Your Portfolio ---",
-        f"Total agents: {total}",
-        f"Active/Productive: {active}",
-        f"At-risk: {at_risk}",
-        f"Dormant: {dormant}",
-        f"New (onboarded): {onboarded}",
-        "",
-    ]
-
-    if priority_agents:
-        lines_en.append("--- Priority Agents Today ---")
-        for i, pa in enumerate(priority_agents, 1):
-            lines_en.append(f"{i}. {pa.agent_name} ({pa.urgency})")
-            lines_en.append(f"   {pa.one_line_context}")
-            lines_en.append(f"   Action: {pa.suggested_action}")
-        lines_en.append("")
-
-    if recent_wins:
-        lines_en.append("--- Celebrations ---")
-        for win in recent_wins[:3]:
-            lines_en.append(f"  {win.get('agent_name', 'Agent')}: {win.get('achievement', '')}")
-        lines_en.append("")
-
-    lines_en.append("--- Today's Action Items ---")
-    for item in action_items:
-        lines_en.append(f"  - {item}")
-
-    formatted_en = "\n".join(lines_en)
-
-    # Format Hindi text
-    lines_hi = [
-        f"Suprabhat, {adm_name} ji!",
-        f"Tarikh: {briefing_date.strftime('%d %b %Y')}",
-        "",
-        "--- Aapka Portfolio ---",
-        f"Total agents: {total}",
-        f"Active/Productive: {active}",
-        f"At-risk: {at_risk}",
-        f"Dormant: {dormant}",
-        f"Naye (onboarded): {onboarded}",
-        "",
-    ]
-
-    if priority_agents:
-        lines_hi.append("--- Aaj ke Priority Agents ---")
-        for i, pa in enumerate(priority_agents, 1):
-            lines_hi.append(f"{i}. {pa.agent_name} ({pa.urgency})")
-            lines_hi.append(f"   {pa.one_line_context}")
-            lines_hi.append(f"   Action: {pa.suggested_action}")
-        lines_hi.append("")
-
-    if recent_wins:
-        lines_hi.append("--- Badhai! ---")
-        for win in recent_wins[:3]:
-            lines_hi.append(f"  {win.get('agent_name', 'Agent')}: {win.get('achievement', '')}")
-        lines_hi.append("")
-
-    lines_hi.append("--- Aaj ke Kaam ---")
-    for item in action_items:
-        lines_hi.append(f"  - {item}")
-
-    formatted_hi = "\n".join(lines_hi)
+    greeting = _BRIEFING_LABELS_EN["greeting"].format(adm_name=adm_name)
+
+    # Everything except the static labels is shared by both languages,
+    # so the dynamic sections are rendered once and slotted into each.
+    sections = {
+        "date": _format_briefing_date(briefing_date),
+        "portfolio": (
+            f"Total agents: {total}\n"
+            f"Active/Productive: {active}\n"
+            f"At-risk: {at_risk}\n"
+            f"Dormant: {dormant}\n"
+        ),
+        "onboarded": onboarded,
+        "priority_rows": "".join(
+            f"{i}. {pa.agent_name} ({pa.urgency})\n"
+            f"   {pa.one_line_context}\n"
+            f"   Action: {pa.suggested_action}\n"
+            for i, pa in enumerate(priority_agents, 1)
+        ),
+        "win_rows": "".join(
+            f"  {win.get('agent_name', 'Agent')}: {win.get('achievement', '')}\n"
+            for win in recent_wins[:3]
+        ),
+        "items": "\n".join(f"  - {item}" for item in action_items),
+    }
+    formatted_en = _render_briefing(_BRIEFING_LABELS_EN, adm_name, sections)
+    formatted_hi = _render_briefing(_BRIEFING_LABELS_HI, adm_name, sections)
 
     return MorningBriefing(
         date=briefing_date,
@@ -452,16 +553,262 @@ def generate_morning_briefing(
 # PART 4: Recommendation Engine
 # ===========================================================================
 
+@dataclass(slots=True, frozen=True)
+class Recommendation:
+    """What the ADM should do next with an agent."""
+    action: str
+    reasoning: str
+    urgency: str = "MEDIUM"  # HIGH | MEDIUM | LOW
+    channel: str = "whatsapp"  # call | whatsapp | visit
+    talking_points: tuple[str, ...] = ()
+    talking_points_hi: tuple[str, ...] = ()
+    suggested_action: str = ""
+    suggested_action_hi: str = ""
+
+
+# Talking points shared by every recommendation of the same kind. Bilingual
+# sets are stored as one (English, Hindi) pair.
+_DORMANT_DISCOVERY_TP = (
+    (
+        "Start with a warm, non-judgmental check-in",
+        "Ask open-ended questions: 'How are things going?'",
+        "Listen for clues about the real reason for inactivity",
+        "Do not push for sales — focus on understanding",
+    ),
+    (
+        "Warm check-in se shuru karein, judge nahi karein",
+        "Open-ended sawaal poochein: 'Sab kaisa chal raha hai?'",
+        "Real reason sunne ki koshish karein",
+        "Sales ke liye push na karein — pehle samjhein",
+    ),
+)
+
+_DORMANT_FOLLOW_UP_TP_EN = (
+    "Reference the previous conversation",
+    "Ask if they had a chance to think about what was discussed",
+    "Offer specific help based on what they shared last time",
+)
+
+_AT_RISK_VISIT_TP_EN = (
+    "Consider an in-person visit — shows you care",
+    "Bring something useful (product material, success stories)",
+    "Ask about their challenges face-to-face",
+    "Create a concrete plan together",
+)
+
+_AT_RISK_CALL_TP_EN = (
+    "Call quickly — timing matters",
+    "Ask if everything is okay without being accusatory",
+    "Offer specific help (training, joint visit, process support)",
+    "Set up a follow-up within the week",
+)
+
+_ONBOARDED_STALLED_TP_EN = (
+    "Understand what is blocking their progress",
+    "Help with exam preparation if not licensed yet",
+    "Walk through the first steps of getting started",
+    "Set specific milestones for the next 2 weeks",
+)
+
+_ONBOARDED_WELCOME_TP_EN = (
+    "Welcome them warmly to the team",
+    "Explain what their first 30 days should look like",
+    "Help them understand the exam and licensing process",
+    "Schedule regular weekly check-ins",
+)
+
+
+@lru_cache(maxsize=128)
+def _dormant_reason_recommendation(dormancy_reason: str | None) -> Recommendation | None:
+    """Recommendation for a known dormancy reason, built once per code.
+
+    The taxonomy is static, so the result is cached and shared; None for
+    missing or unknown codes (the negative answer is cached too).
+    """
+    if not dormancy_reason:
+        return None
+    from domain.dormancy_taxonomy import get_reason_by_code
+
+    reason_info = get_reason_by_code(dormancy_reason)
+    if reason_info is None:
+        return None
+    return Recommendation(
+        action="personalized_outreach",
+        reasoning=reason_info["description_en"],
+        urgency="HIGH",
+        channel="call",
+        talking_points=tuple(reason_info["adm_talking_points"]),
+        suggested_action=reason_info["suggested_action_en"],
+        suggested_action_hi=reason_info["suggested_action_hi"],
+    )
+
+
+def _recommend_dormant(
+    dormancy_reason: str | None,
+    days_in_state: int,
+    last_contact_days_ago: int | None,
+) -> Recommendation:
+    recommendation = _dormant_reason_recommendation(dormancy_reason)
+    if recommendation is not None:
+        return recommendation
+
+    # Unknown dormancy reason
+    if last_contact_days_ago is None or last_contact_days_ago > 30:
+        talking_points, talking_points_hi = _DORMANT_DISCOVERY_TP
+        return Recommendation(
+            action="discovery_call",
+            reasoning="Dormant with unknown reason — need to understand the situation",
+            urgency="HIGH",
+            channel="call",
+            talking_points=talking_points,
+            talking_points_hi=talking_points_hi,
+        )
+    return Recommendation(
+        action="follow_up",
+        reasoning="Recently contacted dormant agent — follow up on previous conversation",
+        urgency="MEDIUM",
+        channel="whatsapp",
+        talking_points=_DORMANT_FOLLOW_UP_TP_EN,
+    )
+
+
+@lru_cache(maxsize=512)
+def _at_risk_reasoning(days_in_state: int) -> str:
+    """Reasoning line for long-running at-risk agents, cached per day count."""
+    return f"At-risk for {days_in_state} days — digital outreach may not be enough"
+
+
+def _recommend_at_risk(
+    dormancy_reason: str | None,
+    days_in_state: int,
+    last_contact_days_ago: int | None,
+) -> Recommendation:
+    if days_in_state > 30:
+        return Recommendation(
+            action="in_person_visit",
+            reasoning=_at_risk_reasoning(days_in_state),
+            urgency="HIGH",
+            channel="visit",
+            talking_points=_AT_RISK_VISIT_TP_EN,
+        )
+    return Recommendation(
+        action="timely_call",
+        reasoning="Recently at-risk — a timely call can prevent dormancy",
+        urgency="HIGH",
+        channel="call",
+        talking_points=_AT_RISK_CALL_TP_EN,
+    )
+
+
+def _recommend_onboarded(
+    dormancy_reason: str | None,
+    days_in_state: int,
+    last_contact_days_ago: int | None,
+) -> Recommendation:
+    if days_in_state > 14:
+        return Recommendation(
+            action="urgent_first_steps",
+            reasoning="Onboarded but no progress in 14+ days — needs help getting started",
+            urgency="HIGH",
+            channel="call",
+            talking_points=_ONBOARDED_STALLED_TP_EN,
+        )
+    return Recommendation(
+        action="welcome_and_orient",
+        reasoning="New agent — help them get licensed and started",
+        urgency="MEDIUM",
+        channel="call",
+        talking_points=_ONBOARDED_WELCOME_TP_EN,
+    )
+
+
+# Recommendations that do not depend on the agent's details. They are
+# immutable, so every call returns the same shared instance.
+_LICENSED_TEMPLATE = Recommendation(
+    action="first_sale_coaching",
+    reasoning="Licensed but no sale yet — focus on getting the first sale",
+    urgency="MEDIUM",
+    channel="call",
+    talking_points=(
+        "Discuss their warm market (family, friends, neighbors)",
+        "Role-play a sales conversation",
+        "Offer to join them for their first customer meeting",
+        "Share simple product comparison sheets they can use",
+    ),
+)
+
+_FIRST_SALE_TEMPLATE = Recommendation(
+    action="build_momentum",
+    reasoning="First sale done — celebrate and build on this momentum",
+    urgency="MEDIUM",
+    channel="whatsapp",
+    talking_points=(
+        "Congratulate them genuinely",
+        "Ask how the sale went — what worked?",
+        "Help them identify the next 3-5 prospects",
+        "Discuss cross-selling opportunities",
+    ),
+)
+
+_PERFORMING_TEMPLATE = Recommendation(
+    action="maintain_engagement",
+    reasoning="Performing well — keep regular engagement",
+    urgency="LOW",
+    channel="whatsapp",
+    talking_points=(
+        "Regular check-in — keep the relationship warm",
+        "Share any new product updates or promotions",
+        "Recognize their achievements",
+        "Discuss their goals for the month",
+    ),
+)
+
+
+# Fallback for states without a specific playbook (e.g. terminated, lapsed)
+_MONITOR_TEMPLATE = Recommendation(
+    action="monitor",
+    reasoning="Keep in touch and monitor progress",
+    urgency="LOW",
+    channel="whatsapp",
+)
+
+
+def _from_template(template: Recommendation) -> Callable[..., Recommendation]:
+    def handler(
+        dormancy_reason: str | None,
+        days_in_state: int,
+        last_contact_days_ago: int | None,
+    ) -> Recommendation:
+        return template
+    return handler
+
+
+# lifecycle_state -> handler(dormancy_reason, days_in_state, last_contact_days_ago).
+# Keyed by plain enum values so lookups with DB strings stay on str's own
+# hash/compare fast path.
+_RECOMMENDATION_HANDLERS: dict[str, Callable[..., Recommendation]] = {
+    _DORMANT: _recommend_dormant,
+    _AT_RISK: _recommend_at_risk,
+    _ONBOARDED: _recommend_onboarded,
+    _LICENSED: _from_template(_LICENSED_TEMPLATE),
+    AgentLifecycleState.FIRST_SALE.value: _from_template(_FIRST_SALE_TEMPLATE),
+    AgentLifecycleState.ACTIVE.value: _from_template(_PERFORMING_TEMPLATE),
+    AgentLifecycleState.PRODUCTIVE.value: _from_template(_PERFORMING_TEMPLATE),
+}
+_recommend_default = _from_template(_MONITOR_TEMPLATE)
+
+
 def get_recommendation_for_agent(
     lifecycle_state: str,
     dormancy_reason: str | None = None,
     days_in_state: int = 0,
     engagement_score: float = 0.0,
     last_contact_days_ago: int | None = None,
-) -> dict:
+) -> Recommendation:
     """Generate a recommendation for what action to take with an agent.
 
-    Returns a dict with: action, reasoning, urgency, channel, talking_points.
+    Returns a Recommendation; use ``dataclasses.asdict()`` where a
+    JSON-ready dict is needed.
 
     Args:
         lifecycle_state: Agent's current state.
@@ -470,152 +817,36 @@ def get_recommendation_for_agent(
         engagement_score: Current engagement score (0-100).
         last_contact_days_ago: Days since last contact (None if never contacted).
     """
-    result = {
-        "action": "check_in",
-        "reasoning": "",
-        "urgency": "MEDIUM",
-        "channel": "whatsapp",
-        "talking_points": [],
-        "talking_points_hi": [],
-    }
+    handler = _RECOMMENDATION_HANDLERS.get(lifecycle_state, _recommend_default)
+    return handler(dormancy_reason, days_in_state, last_contact_days_ago)
 
-    # DORMANT agents
-    if lifecycle_state == AgentLifecycleState.DORMANT:
-        if dormancy_reason:
-            reason_info = get_reason_by_code(dormancy_reason)
-            if reason_info:
-                result["action"] = "personalized_outreach"
-                result["reasoning"] = reason_info.get("description_en", "")
-                result["urgency"] = "HIGH"
-                result["channel"] = "call"
-                result["talking_points"] = reason_info.get("adm_talking_points", [])
-                result["suggested_action"] = reason_info.get("suggested_action_en", "")
-                result["suggested_action_hi"] = reason_info.get("suggested_action_hi", "")
-                return result
-
-        # Unknown dormancy reason
-        if last_contact_days_ago is None or last_contact_days_ago > 30:
-            result["action"] = "discovery_call"
-            result["reasoning"] = "Dormant with unknown reason — need to understand the situation"
-            result["urgency"] = "HIGH"
-            result["channel"] = "call"
-            result["talking_points"] = [
-                "Start with a warm, non-judgmental check-in",
-                "Ask open-ended questions: 'How are things going?'",
-                "Listen for clues about the real reason for inactivity",
-                "Do not push for sales — focus on understanding",
-            ]
-            result["talking_points_hi"] = [
-                "Warm check-in se shuru karein, judge nahi karein",
-                "Open-ended sawaal poochein: 'Sab kaisa chal raha hai?'",
-                "Real reason sunne ki koshish karein",
-                "Sales ke liye push na karein — pehle samjhein",
-            ]
-        else:
-            result["action"] = "follow_up"
-            result["reasoning"] = "Recently contacted dormant agent — follow up on previous conversation"
-            result["urgency"] = "MEDIUM"
-            result["talking_points"] = [
-                "Reference the previous conversation",
-                "Ask if they had a chance to think about what was discussed",
-                "Offer specific help based on what they shared last time",
-            ]
-
-    # AT_RISK agents
-    elif lifecycle_state == AgentLifecycleState.AT_RISK:
-        if days_in_state > 30:
-            result["action"] = "in_person_visit"
-            result["reasoning"] = f"At-risk for {days_in_state} days — digital outreach may not be enough"
-            result["urgency"] = "HIGH"
-            result["channel"] = "visit"
-            result["talking_points"] = [
-                "Consider an in-person visit — shows you care",
-                "Bring something useful (product material, success stories)",
-                "Ask about their challenges face-to-face",
-                "Create a concrete plan together",
-            ]
-        else:
-            result["action"] = "timely_call"
-            result["reasoning"] = "Recently at-risk — a timely call can prevent dormancy"
-            result["urgency"] = "HIGH"
-            result["channel"] = "call"
-            result["talking_points"] = [
-                "Call quickly — timing matters",
-                "Ask if everything is okay without being accusatory",
-                "Offer specific help (training, joint visit, process support)",
-                "Set up a follow-up within the week",
-            ]
-
-    # ONBOARDED agents
-    elif lifecycle_state == AgentLifecycleState.ONBOARDED:
-        if days_in_state > 14:
-            result["action"] = "urgent_first_steps"
-            result["reasoning"] = "Onboarded but no progress in 14+ days — needs help getting started"
-            result["urgency"] = "HIGH"
-            result["channel"] = "call"
-            result["talking_points"] = [
-                "Understand what is blocking their progress",
-                "Help with exam preparation if not licensed yet",
-                "Walk through the first steps of getting started",
-                "Set specific milestones for the next 2 weeks",
-            ]
-        else:
-            result["action"] = "welcome_and_orient"
-            result["reasoning"] = "New agent — help them get licensed and started"
-            result["urgency"] = "MEDIUM"
-            result["channel"] = "call"
-            result["talking_points"] = [
-                "Welcome them warmly to the team",
-                "Explain what their first 30 days should look like",
-                "Help them understand the exam and licensing process",
-                "Schedule regular weekly check-ins",
-            ]
-
-    # LICENSED agents
-    elif lifecycle_state == AgentLifecycleState.LICENSED:
-        result["action"] = "first_sale_coaching"
-        result["reasoning"] = "Licensed but no sale yet — focus on getting the first sale"
-        result["urgency"] = "MEDIUM"
-        result["channel"] = "call"
-        result["talking_points"] = [
-            "Discuss their warm market (family, friends, neighbors)",
-            "Role-play a sales conversation",
-            "Offer to join them for their first customer meeting",
-            "Share simple product comparison sheets they can use",
-        ]
-
-    # FIRST_SALE agents
-    elif lifecycle_state == AgentLifecycleState.FIRST_SALE:
-        result["action"] = "build_momentum"
-        result["reasoning"] = "First sale done — celebrate and build on this momentum"
-        result["urgency"] = "MEDIUM"
-        result["channel"] = "whatsapp"
-        result["talking_points"] = [
-            "Congratulate them genuinely",
-            "Ask how the sale went — what worked?",
-            "Help them identify the next 3-5 prospects",
-            "Discuss cross-selling opportunities",
-        ]
-
-    # ACTIVE/PRODUCTIVE agents
-    elif lifecycle_state in (AgentLifecycleState.ACTIVE, AgentLifecycleState.PRODUCTIVE):
-        result["action"] = "maintain_engagement"
-        result["reasoning"] = "Performing well — keep regular engagement"
-        result["urgency"] = "LOW"
-        result["channel"] = "whatsapp"
-        result["talking_points"] = [
-            "Regular check-in — keep the relationship warm",
-            "Share any new product updates or promotions",
-            "Recognize their achievements",
-            "Discuss their goals for the month",
-        ]
 
-    else:
-        result["action"] = "monitor"
-        result["reasoning"] = "Keep in touch and monitor progress"
-        result["urgency"] = "LOW"
+def get_recommendations_for_agents(
+    rows: Sequence[tuple[str, str | None, int, float, int | None]],
+) -> list[Recommendation]:
+    """Batch form of get_recommendation_for_agent.
+
+    Args:
+        rows: One tuple per agent, in get_recommendation_for_agent's argument
+              order: (lifecycle_state, dormancy_reason, days_in_state,
+              engagement_score, last_contact_days_ago).
 
-    return result
+    Returns:
+        Recommendations in the same order as ``rows``.
+    """
+    # Partition row indices by state (one pass, no sort), then resolve each
+    # state's handler once and run it over its own rows only.
+    groups: dict[str, list[int]] = {}
+    for i, row in enumerate(rows):
+        groups.setdefault(row[0], []).append(i)
+
+    out: list[Recommendation] = [None] * len(rows)  # type: ignore[list-item]
+    for state, indices in groups.items():
+        handler = _RECOMMENDATION_HANDLERS.get(state, _recommend_default)
+        for i in indices:
+            _, reason, days_in_state, _, last_contact = rows[i]
+            out[i] = handler(reason, days_in_state, last_contact)
+    return out
 
 
 # ===========================================================================
@@ -710,6 +941,36 @@ EMPATHY_RESPONSES: dict[str, dict] = {
     },
 }
 
+# Freeze into shared read-only containers; lookups never allocate.
+EMPATHY_RESPONSES: Mapping[str, Mapping[str, tuple[str, ...]]] = MappingProxyType({
+    theme: MappingProxyType({lang: tuple(lines) for lang, lines in variants.items()})
+    for theme, variants in EMPATHY_RESPONSES.items()
+})
+
+# (theme, language) -> variants, so the common case is a single lookup
+_EMPATHY_FLAT: dict[tuple[str, str], tuple[str, ...]] = {
+    (theme, lang): lines
+    for theme, variants in EMPATHY_RESPONSES.items()
+    for lang, lines in variants.items()
+}
+
+# Every theme/language carries the same number of variants
+_EMPATHY_VARIANTS = 3
+assert all(len(lines) == _EMPATHY_VARIANTS for lines in _EMPATHY_FLAT.values()), (
+    "every EMPATHY_RESPONSES entry must have exactly 3 variants"
+)
+
+
+def _empathy_fallback(complaint_theme: str, language: str) -> tuple[str, ...]:
+    """Variants for an unknown theme or language pair."""
+    # Unknown themes fall back to general frustration
+    theme = complaint_theme if EMPATHY_RESPONSES.get(complaint_theme) else "general_frustration"
+    # Unknown languages fall back to Hindi
+    responses = _EMPATHY_FLAT.get((theme, language))
+    if responses is None:
+        responses = _EMPATHY_FLAT.get((theme, "hi"), ())
+    return responses
+
 
 def get_empathy_response(
     complaint_theme: str,
@@ -726,18 +987,35 @@ def get_empathy_response(
     Returns:
         An empathy response string, or None if theme not found.
     """
-    theme_data = EMPATHY_RESPONSES.get(complaint_theme)
-    if not theme_data:
-        # Try general frustration as fallback
-        theme_data = EMPATHY_RESPONSES.get("general_frustration")
-    if not theme_data:
-        return None
-
-    responses = theme_data.get(language, theme_data.get("hi", []))
+    responses = _EMPATHY_FLAT.get((complaint_theme, language))
+    if responses is None:
+        responses = _empathy_fallback(complaint_theme, language)
     if not responses:
         return None
 
-    return responses[index % len(responses)]
+    return responses[index % _EMPATHY_VARIANTS]
+
+
+# Dormancy reason code -> empathy theme; unmapped codes fall back to
+# general_frustration.
+_EMPATHY_THEME_MAP: Mapping[str, str] = MappingProxyType({
+    "economic.commission_too_low": "commission_low",
+    "economic.competitor_better_commission": "competitor_concern",
+    "economic.irregular_payments": "commission_low",
+    "economic.insufficient_income": "commission_low",
+    "engagement_gap.adm_never_contacted": "no_support",
+    "engagement_gap.adm_no_followthrough": "no_support",
+    "engagement_gap.feels_unsupported": "no_support",
+    "engagement_gap.no_recognition": "no_support",
+    "operational.proposal_process_complex": "process_difficulty",
+    "operational.technology_barriers": "process_difficulty",
+    "operational.claim_experience_bad": "general_frustration",
+    "operational.slow_issuance": "general_frustration",
+    "operational.kyc_issues": "process_difficulty",
+    "personal.health_issues": "health_issues",
+    "personal.lost_interest": "lost_interest",
+    "personal.other_employment": "lost_interest",
+})
 
 
 def suggest_empathy_theme(dormancy_reason_code: str | None) -> str:
@@ -749,37 +1027,22 @@ def suggest_empathy_theme(dormancy_reason_code: str | None) -> str:
     Returns:
         The matching empathy theme key.
     """
-    if not dormancy_reason_code:
-        return "general_frustration"
-
-    category = dormancy_reason_code.split(".")[0] if "." in dormancy_reason_code else ""
-
-    mapping = {
-        "economic.commission_too_low": "commission_low",
-        "economic.competitor_better_commission": "competitor_concern",
-        "economic.irregular_payments": "commission_low",
-        "economic.insufficient_income": "commission_low",
-        "engagement_gap.adm_never_contacted": "no_support",
-        "engagement_gap.adm_no_followthrough": "no_support",
-        "engagement_gap.feels_unsupported": "no_support",
-        "engagement_gap.no_recognition": "no_support",
-        "operational.proposal_process_complex": "process_difficulty",
-        "operational.technology_barriers": "process_difficulty",
-        "operational.claim_experience_bad": "general_frustration",
-        "operational.slow_issuance": "general_frustration",
-        "operational.kyc_issues": "process_difficulty",
-        "personal.health_issues": "health_issues",
-        "personal.lost_interest": "lost_interest",
-        "personal.other_employment": "lost_interest",
-    }
-
-    return mapping.get(dormancy_reason_code, "general_frustration")
+    return _EMPATHY_THEME_MAP.get(dormancy_reason_code, "general_frustration")
 
 
 # ===========================================================================
 # PART 6: System Recommendation (for Agent Detail view)
 # ===========================================================================
 
+# States whose system recommendation is a fixed line
+_SIMPLE_SYSTEM_RECOMMENDATIONS: Mapping[str, str] = MappingProxyType({
+    _LICENSED: "Licensed but no sale yet — focus on first-sale coaching",
+    AgentLifecycleState.FIRST_SALE.value: "First sale done — celebrate and build momentum",
+    AgentLifecycleState.ACTIVE.value: "Performing well — continue regular engagement",
+    AgentLifecycleState.PRODUCTIVE.value: "Performing well — continue regular engagement",
+})
+
+
 def compute_system_recommendation(
     lifecycle_state: str,
     days_in_state: int = 0,
@@ -793,32 +1056,29 @@ def compute_system_recommendation(
     Returns:
         A concise recommendation string.
     """
-    if lifecycle_state == AgentLifecycleState.DORMANT:
+    simple = _SIMPLE_SYSTEM_RECOMMENDATIONS.get(lifecycle_state)
+    if simple is not None:
+        return simple
+
+    if lifecycle_state == _DORMANT:
         if last_positive_signal_days_ago is not None and last_positive_signal_days_ago <= 7:
             return "Re-engagement window open — call now while interest is fresh"
         if dormancy_reason:
+            from domain.dormancy_taxonomy import get_reason_by_code
+
             reason_info = get_reason_by_code(dormancy_reason)
             if reason_info:
-                return reason_info.get("suggested_action_en", "Try a personal call to understand what is happening")
+                return reason_info["suggested_action_en"]
         return "Dormant agent — try a personal call to understand what is happening"
 
-    if lifecycle_state == AgentLifecycleState.AT_RISK:
+    if lifecycle_state == _AT_RISK:
         if days_in_state > 30:
             return "At-risk for over a month — consider an in-person visit"
         return "Recently at-risk — a timely call can prevent dormancy"
 
-    if lifecycle_state == AgentLifecycleState.ONBOARDED:
+    if lifecycle_state == _ONBOARDED:
         if days_in_state > 14:
             return "Onboarded but no progress — help with first steps"
         return "New agent — help them get licensed and started"
 
-    if lifecycle_state == AgentLifecycleState.LICENSED:
-        return "Licensed but no sale yet — focus on first-sale coaching"
-
-    if lifecycle_state == AgentLifecycleState.FIRST_SALE:
-        return "First sale done — celebrate and build momentum"
-
-    if lifecycle_state in (AgentLifecycleState.ACTIVE, AgentLifecycleState.PRODUCTIVE):
-        return "Performing well — continue regular engagement"
-
     return "Keep in touch and monitor progress"
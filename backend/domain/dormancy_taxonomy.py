@@ -13,6 +13,14 @@ This taxonomy powers:
 """
 from __future__ import annotations
 
+import sys
+from collections import Counter
+from functools import lru_cache
+from bisect import bisect_left
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
 from domain.enums import DormancyReasonCategory, DormancyReasonCode
 
 
@@ -602,17 +610,85 @@ DORMANCY_TAXONOMY: list[dict] = [
 # Lookup Helpers
 # ---------------------------------------------------------------------------
 
-# Build fast-lookup indexes
-_CODE_INDEX: dict[str, dict] = {r["code"]: r for r in DORMANCY_TAXONOMY}
-_CATEGORY_INDEX: dict[str, list[dict]] = {}
+# Build fast-lookup indexes, keyed by interned plain-string values so lookups
+# with codes read from the DB/JSON hit on identity.
+_CODE_INDEX: dict[str, dict] = {sys.intern(r["code"].value): r for r in DORMANCY_TAXONOMY}
+# Category buckets are tuples so the shared index cannot be mutated
+_CATEGORY_INDEX: dict[str, tuple[dict, ...]] = {}
 for _reason in DORMANCY_TAXONOMY:
-    _cat = _reason["category"]
-    _CATEGORY_INDEX.setdefault(_cat, []).append(_reason)
-
+    _cat = sys.intern(_reason["category"].value)
+    _CATEGORY_INDEX[_cat] = (*_CATEGORY_INDEX.get(_cat, ()), _reason)
+
+# Column (structure-of-arrays) view of the taxonomy for the scanning paths:
+# position i in every column is DORMANCY_TAXONOMY[i]. Detection hints are
+# flattened CSR-style, reason i owning _HINTS_FLAT[_HINT_OFFSETS[i]:_HINT_OFFSETS[i + 1]].
+# Hints are lowercased (and interned) once, for matching against lowercased text.
+_CODES: tuple[str, ...] = tuple(r["code"] for r in DORMANCY_TAXONOMY)
+_CATEGORIES: tuple[str, ...] = tuple(r["category"] for r in DORMANCY_TAXONOMY)
+_HINTS_FLAT: tuple[str, ...] = tuple(
+    sys.intern(hint.lower()) for r in DORMANCY_TAXONOMY for hint in r["detection_hints"]
+)
+_HINT_OFFSETS: tuple[int, ...] = (0, *accumulate(
+    len(r["detection_hints"]) for r in DORMANCY_TAXONOMY
+))
+
+# Category -> reason codes, in taxonomy order
+_CATEGORY_CODES: dict[str, tuple[str, ...]] = {
+    cat: tuple(code for code, c in zip(_CODES, _CATEGORIES) if c == cat)
+    for cat in _CATEGORY_INDEX
+}
 
-def get_dormancy_taxonomy() -> list[dict]:
-    """Return the full dormancy taxonomy (copy for safety)."""
-    return list(DORMANCY_TAXONOMY)
+# Small-int category ids (DormancyReasonCategory declaration order) so the
+# category rollup is list arithmetic; reasons already use column positions.
+_CATEGORY_LIST: tuple[str, ...] = tuple(DormancyReasonCategory)
+_CATEGORY_TO_INDEX: dict[str, int] = {cat: i for i, cat in enumerate(_CATEGORY_LIST)}
+_CATEGORY_OF_REASON: tuple[int, ...] = tuple(_CATEGORY_TO_INDEX[c] for c in _CATEGORIES)
+
+# Inverted index: lowercased hint -> positions (into the columns above) of
+# every reason listing it, once per listing, so a reason that repeats a hint
+# still scores it twice. Hints shared across reasons are searched for once.
+_HINT_INDEX: dict[str, list[int]] = {}
+for _i in range(len(_CODES)):
+    for _hint in _HINTS_FLAT[_HINT_OFFSETS[_i]:_HINT_OFFSETS[_i + 1]]:
+        _HINT_INDEX.setdefault(_hint, []).append(_i)
+
+# Frozen (hint, reason positions) pairs for the scan loop. A plain `hint in text` per
+# distinct hint (C-level substring search) measured ~2x faster than a
+# compiled re alternation over the same hints, even on text with no hits,
+# so no regex prefilter is used.
+_HINT_SCAN: tuple[tuple[str, tuple[int, ...]], ...] = tuple(
+    (hint, tuple(positions)) for hint, positions in _HINT_INDEX.items()
+)
+
+# Shortest detection hint; no shorter text can match anything
+_MIN_HINT_LEN: int = min(map(len, _HINTS_FLAT), default=0) or 1
+
+# Prefix tier for short texts: hints bucketed by their first 4 characters.
+# Any hint occurring in the text has its prefix among the text's 4-char
+# windows, so checking only the hints under those windows (plus the few
+# hints shorter than 4 characters) gives exactly the full scan's scores.
+# It measured 2-4x faster than the full scan below ~100 characters and
+# loses to it past ~120, hence the length gate.
+_PREFIX_LEN = 4
+_PREFIX_TIER_MAX_LEN = 96
+_SHORT_HINT_SCAN: tuple[tuple[str, tuple[int, ...]], ...] = tuple(
+    (hint, positions) for hint, positions in _HINT_SCAN if len(hint) < _PREFIX_LEN
+)
+_PREFIX_INDEX: dict[str, tuple[tuple[str, tuple[int, ...]], ...]] = {}
+for _hint, _positions in _HINT_SCAN:
+    if len(_hint) >= _PREFIX_LEN:
+        _prefix = _hint[:_PREFIX_LEN]
+        _PREFIX_INDEX[_prefix] = (*_PREFIX_INDEX.get(_prefix, ()), (_hint, _positions))
+
+
+# Shared snapshot handed out by get_dormancy_taxonomy; a per-call list copy
+# gave no real protection since the reason dicts inside were shared anyway.
+_TAXONOMY_VIEW: tuple[dict, ...] = tuple(DORMANCY_TAXONOMY)
+
+
+def get_dormancy_taxonomy() -> tuple[dict, ...]:
+    """Return the full dormancy taxonomy (shared, treat as read-only)."""
+    return _TAXONOMY_VIEW
 
 
 def get_reason_by_code(code: str) -> dict | None:
@@ -622,25 +698,152 @@ def get_reason_by_code(code: str) -> dict | None:
 
 def get_reasons_by_category(category: str) -> list[dict]:
     """Return all reasons for a given parent category."""
-    return _CATEGORY_INDEX.get(category, [])
+    return list(_CATEGORY_INDEX.get(category, ()))
+
+
+# Category display names in Hindi
+_CATEGORY_NAMES_HI: Mapping[str, str] = MappingProxyType({
+    DormancyReasonCategory.TRAINING_GAP: "Training ki Kami",
+    DormancyReasonCategory.ENGAGEMENT_GAP: "Support ki Kami",
+    DormancyReasonCategory.ECONOMIC: "Paison ki Chinta",
+    DormancyReasonCategory.OPERATIONAL: "Process ki Dikkat",
+    DormancyReasonCategory.PERSONAL: "Personal Wajah",
+    DormancyReasonCategory.REGULATORY: "License / Compliance",
+    DormancyReasonCategory.UNKNOWN: "Wajah Pata Nahi",
+})
 
+# Per-category summary served by get_category_summary
+_CATEGORY_SUMMARY: tuple[dict, ...] = tuple(
+    {
+        "category": cat,
+        "name_en": cat.replace("_", " ").title(),
+        "name_hi": _CATEGORY_NAMES_HI.get(cat, cat),
+        "count": len(_CATEGORY_CODES.get(cat, ())),
+        "reason_codes": tuple(_CATEGORY_CODES.get(cat, ())),
+    }
+    for cat in DormancyReasonCategory
+)
+
+
+def get_category_summary() -> tuple[dict, ...]:
+    """Return a summary of each category with count and reason names.
+
+    The taxonomy is static, so the summary is built once at import and
+    shared (read-only).
+    """
+    return _CATEGORY_SUMMARY
+
+
+# Only texts up to this length are memoized. Stock replies and templates
+# repeat; long free-text notes are nearly always unique and would just pin
+# up to 1024 transcripts in memory.
+_SCORE_CACHE_MAX_LEN = 160
 
-def get_category_summary() -> list[dict]:
-    """Return a summary of each category with count and reason names."""
-    summaries = []
-    for cat in DormancyReasonCategory:
-        reasons = _CATEGORY_INDEX.get(cat, [])
-        summaries.append({
-            "category": cat,
-            "name_en": cat.replace("_", " ").title(),
-            "name_hi": _CATEGORY_NAMES_HI.get(cat, cat),
-            "count": len(reasons),
-            "reason_codes": [r["code"] for r in reasons],
-        })
-    return summaries
 
+def _score_reasons(text_lower: str) -> tuple[int, ...]:
+    """Hint-match score per reason, indexed like the column tuples."""
+    if len(text_lower) <= _SCORE_CACHE_MAX_LEN:
+        return _score_reasons_cached(text_lower)
+    return _scan_scores(text_lower)
+
+
+@lru_cache(maxsize=1024)
+def _score_reasons_cached(text_lower: str) -> tuple[int, ...]:
+    """_scan_scores memoized on the normalized (short) text.
+
+    The taxonomy never changes at runtime, so entries never go stale.
+    """
+    return _scan_scores(text_lower)
+
+
+def _scan_scores(text_lower: str) -> tuple[int, ...]:
+    """Scan the detection hints against lowercased text."""
+    scores = [0] * len(_CODES)
+    if len(text_lower) < _PREFIX_TIER_MAX_LEN:
+        candidates = [*_SHORT_HINT_SCAN]
+        bucket = _PREFIX_INDEX.get
+        for window in {
+            text_lower[i:i + _PREFIX_LEN]
+            for i in range(len(text_lower) - _PREFIX_LEN + 1)
+        }:
+            hits = bucket(window)
+            if hits:
+                candidates += hits
+    else:
+        candidates = _HINT_SCAN
+    for hint, positions in candidates:
+        if hint in text_lower:
+            for i in positions:
+                scores[i] += 1
+    return tuple(scores)
+
+
+def classify_hints(text: str) -> Counter[str]:
+    """Count detection-hint matches per reason code in free text.
+
+    A hint counts once per reason that lists it when it occurs anywhere in
+    the (lowercased) text, matching detect_dormancy_reason's scoring.
+    """
+    if not text:
+        return Counter()
+    scores = _score_reasons(text.lower())
+    return Counter({code: score for code, score in zip(_CODES, scores) if score})
 
-def detect_dormancy_reason(text: str) -> list[dict]:
+
+# Separator for batch scans. No hint contains it, so no match can straddle
+# two texts; text boundaries come from lengths, not from finding it.
+_BATCH_SEPARATOR = "\x1f"
+
+
+def classify_hints_batch(texts: Sequence[str]) -> list[Counter[str]]:
+    """classify_hints over many texts with one scan per hint.
+
+    The texts are joined into a single buffer and each distinct hint is
+    searched across all of them at once (str.find from the last hit), so
+    Python-level work scales with hits rather than texts x hints.
+
+    Returns:
+        One Counter per input text, in order (empty for empty/no-hit text).
+    """
+    lowered = [(t or "").lower() for t in texts]
+    joined = _BATCH_SEPARATOR.join(lowered)
+    # ends[d] is the offset of the separator after text d
+    ends = list(accumulate(len(t) + 1 for t in lowered))
+
+    scores = [[0] * len(_CODES) for _ in lowered]
+    find = joined.find
+    for hint, positions in _HINT_SCAN:
+        start = find(hint)
+        while start != -1:
+            doc = bisect_left(ends, start + 1)
+            row = scores[doc]
+            for i in positions:
+                row[i] += 1
+            # A hint counts once per text; resume at the next text
+            start = find(hint, ends[doc])
+
+    return [
+        Counter({code: score for code, score in zip(_CODES, row) if score})
+        for row in scores
+    ]
+
+
+def classify_categories(text: str) -> Counter[str]:
+    """Roll detection-hint scores up to dormancy categories.
+
+    Returns a Counter of category -> summed hint score of its reasons.
+    """
+    if not text:
+        return Counter()
+    category_scores = [0] * len(_CATEGORY_LIST)
+    for cat_idx, score in zip(_CATEGORY_OF_REASON, _score_reasons(text.lower())):
+        category_scores[cat_idx] += score
+    return Counter({
+        cat: score for cat, score in zip(_CATEGORY_LIST, category_scores) if score
+    })
+
+
+def detect_dormancy_reason(text: str, codes_only: bool = False) -> list[dict]:
     """Detect possible dormancy reasons from free text (agent conversation).
 
     Returns a list of matching reasons sorted by number of hint matches
@@ -649,37 +852,28 @@ def detect_dormancy_reason(text: str) -> list[dict]:
 
     Args:
         text: Free-text input from agent conversation (Hindi or English).
+        codes_only: Return slim {'code', 'match_score'} dicts instead of
+                    copying each full reason (look one up later via
+                    get_reason_by_code).
 
     Returns:
-        List of matching reason dicts with a 'match_score' field added.
+        List of matching reason dicts with a 'match_score' field added
+        (or slim code/score dicts when codes_only is set).
     """
-    if not text:
+    # Too short or blank to contain any hint: skip the scan (and its cache)
+    text_lower = text.lower() if text else ""
+    if len(text_lower) < _MIN_HINT_LEN or text_lower.isspace():
         return []
 
-    text_lower = text.lower()
-    matches = []
-
-    for reason in DORMANCY_TAXONOMY:
-        hints = reason.get("detection_hints", [])
-        if not hints:
-            continue
-        score = sum(1 for hint in hints if hint.lower() in text_lower)
-        if score > 0:
-            result = dict(reason)
-            result["match_score"] = score
-            matches.append(result)
-
-    matches.sort(key=lambda r: r["match_score"], reverse=True)
-    return matches
-
-
-# Category display names in Hindi
-_CATEGORY_NAMES_HI: dict[str, str] = {
-    DormancyReasonCategory.TRAINING_GAP: "Training ki Kami",
-    DormancyReasonCategory.ENGAGEMENT_GAP: "Support ki Kami",
-    DormancyReasonCategory.ECONOMIC: "Paison ki Chinta",
-    DormancyReasonCategory.OPERATIONAL: "Process ki Dikkat",
-    DormancyReasonCategory.PERSONAL: "Personal Wajah",
-    DormancyReasonCategory.REGULATORY: "License / Compliance",
-    DormancyReasonCategory.UNKNOWN: "Wajah Pata Nahi",
-}
+    scores = _score_reasons(text_lower)
+
+    # Rank positions on the int scores (stable, so ties keep taxonomy
+    # order), then build each result dict in one step.
+    ranked = sorted(
+        (i for i, score in enumerate(scores) if score),
+        key=scores.__getitem__,
+        reverse=True,
+    )
+    if codes_only:
+        return [{"code": _CODES[i], "match_score": scores[i]} for i in ranked]
+    return [{**DORMANCY_TAXONOMY[i], "match_score": scores[i]} for i in ranked]
@@ -23,28 +23,63 @@ State Diagram:
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from domain.enums import AgentLifecycleState, SignalType
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-in for a missing signal payload.
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
 
 # ---------------------------------------------------------------------------
 # Positive Signal Classification
 # ---------------------------------------------------------------------------
 
-ALWAYS_POSITIVE_SIGNALS: set[str] = {
+ALWAYS_POSITIVE_SIGNALS: frozenset[str] = frozenset({
     SignalType.POLICY_SOLD,
     SignalType.WHATSAPP_AGENT_REPLIED,
     SignalType.TRAINING_COMPLETED,
     SignalType.ADM_AGENT_VISIT_LOGGED,
+})
+
+
+# Payload-dependent signals: positive outcome values and per-signal predicates.
+_VOICE_POSITIVE = frozenset({"answered", "completed"})
+_ADM_POSITIVE = frozenset({"CONNECTED", "DETAILED_DISCUSSION"})
+_QUIZ_COMPLETED = "QUIZ_COMPLETED"
+
+
+def _voice_call_positive(payload: Mapping[str, Any]) -> bool:
+    return payload.get("outcome") in _VOICE_POSITIVE
+
+
+def _training_interaction_positive(payload: Mapping[str, Any]) -> bool:
+    pget = payload.get
+    # `or 0` also covers an explicit null completion_percentage
+    return (
+        (pget("completion_percentage") or 0) > 50
+        or pget("interaction_type") == _QUIZ_COMPLETED
+    )
+
+
+def _adm_call_positive(payload: Mapping[str, Any]) -> bool:
+    return payload.get("outcome") in _ADM_POSITIVE
+
+
+_POSITIVE_PREDICATES: dict[str, callable] = {
+    SignalType.VOICE_CALL_OUTCOME: _voice_call_positive,
+    SignalType.WHATSAPP_TRAINING_INTERACTION: _training_interaction_positive,
+    SignalType.ADM_AGENT_CALL_LOGGED: _adm_call_positive,
 }
 
 
-def is_positive_signal(signal_type: str, payload: dict | None = None) -> bool:
+def is_positive_signal(signal_type: str, payload: Mapping[str, Any] | None = None) -> bool:
     """Evaluate whether a specific signal instance is a positive engagement signal.
 
     Some signals are always positive (e.g., policy sold). Others depend on
@@ -60,29 +95,17 @@ def is_positive_signal(signal_type: str, payload: dict | None = None) -> bool:
     if signal_type in ALWAYS_POSITIVE_SIGNALS:
         return True
 
-    payload = payload or {}
-
-    if signal_type == SignalType.VOICE_CALL_OUTCOME:
-        return payload.get("outcome") in ("answered", "completed")
-
-    if signal_type == SignalType.WHATSAPP_TRAINING_INTERACTION:
-        completion = payload.get("completion_percentage", 0) or 0
-        return (
-            completion > 50
-            or payload.get("interaction_type") == "QUIZ_COMPLETED"
-        )
-
-    if signal_type == SignalType.ADM_AGENT_CALL_LOGGED:
-        return payload.get("outcome") in ("CONNECTED", "DETAILED_DISCUSSION")
-
-    return False
+    predicate = _POSITIVE_PREDICATES.get(signal_type)
+    if predicate is None:
+        return False
+    return predicate(payload if payload is not None else _EMPTY_PAYLOAD)
 
 
 # ---------------------------------------------------------------------------
 # Agent Context (lightweight — works without ORM dependency)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Minimal agent data needed for lifecycle transitions.
 
@@ -100,7 +123,7 @@ class AgentContext:
 # State-Specific Transition Handlers
 # ---------------------------------------------------------------------------
 
-def _check_onboarded(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_onboarded(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from ONBOARDED."""
     if signal_type == SignalType.LICENSE_STATUS_CHANGED:
         if payload.get("new_status") == "ACTIVE":
@@ -111,14 +134,14 @@ def _check_onboarded(signal_type: str, payload: dict, agent: AgentContext) -> st
     return None
 
 
-def _check_licensed(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_licensed(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from LICENSED."""
     if signal_type == SignalType.POLICY_SOLD:
         return AgentLifecycleState.FIRST_SALE
     return None
 
 
-def _check_first_sale(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_first_sale(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from FIRST_SALE."""
     if signal_type == SignalType.POLICY_SOLD:
         # 2+ total policies (including the one being signaled) -> ACTIVE
@@ -127,7 +150,7 @@ def _check_first_sale(signal_type: str, payload: dict, agent: AgentContext) -> s
     return None
 
 
-def _check_active(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_active(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from ACTIVE.
 
     ACTIVE -> PRODUCTIVE requires sustained performance, typically evaluated
@@ -137,7 +160,7 @@ def _check_active(signal_type: str, payload: dict, agent: AgentContext) -> str |
     return None
 
 
-def _check_productive(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_productive(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from PRODUCTIVE.
 
     PRODUCTIVE -> AT_RISK is evaluated by periodic batch process.
@@ -145,7 +168,7 @@ def _check_productive(signal_type: str, payload: dict, agent: AgentContext) -> s
     return None
 
 
-def _check_at_risk(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_at_risk(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from AT_RISK."""
     # A sale brings them back to ACTIVE immediately
     if signal_type == SignalType.POLICY_SOLD:
@@ -158,7 +181,7 @@ def _check_at_risk(signal_type: str, payload: dict, agent: AgentContext) -> str
     return None
 
 
-def _check_dormant(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_dormant(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from DORMANT."""
     # A sale brings them back to ACTIVE
     if signal_type == SignalType.POLICY_SOLD:
@@ -170,7 +193,7 @@ def _check_dormant(signal_type: str, payload: dict, agent: AgentContext) -> str
     return None
 
 
-def _check_lapsed(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_lapsed(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """Transitions from LAPSED (license expired)."""
     if signal_type == SignalType.LICENSE_STATUS_CHANGED:
         if payload.get("new_status") == "ACTIVE":
@@ -178,30 +201,25 @@ def _check_lapsed(signal_type: str, payload: dict, agent: AgentContext) -> str |
     return None
 
 
-def _check_terminated(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
+def _check_terminated(signal_type: str, payload: Mapping[str, Any], agent: AgentContext) -> str | None:
     """TERMINATED is a final state. No automatic transitions out."""
     return None
 
 
-def _check_global(signal_type: str, payload: dict, agent: AgentContext) -> str | None:
-    """Global transitions that apply from ANY state (checked first)."""
-    if signal_type == SignalType.LICENSE_STATUS_CHANGED:
-        if payload.get("new_status") == "EXPIRED":
-            return AgentLifecycleState.LAPSED
-    return None
-
-
-# Handler dispatch table
+# Handler dispatch table, keyed by interned plain-string state values
 _STATE_HANDLERS: dict[str, callable] = {
-    AgentLifecycleState.ONBOARDED: _check_onboarded,
-    AgentLifecycleState.LICENSED: _check_licensed,
-    AgentLifecycleState.FIRST_SALE: _check_first_sale,
-    AgentLifecycleState.ACTIVE: _check_active,
-    AgentLifecycleState.PRODUCTIVE: _check_productive,
-    AgentLifecycleState.AT_RISK: _check_at_risk,
-    AgentLifecycleState.DORMANT: _check_dormant,
-    AgentLifecycleState.LAPSED: _check_lapsed,
-    AgentLifecycleState.TERMINATED: _check_terminated,
+    sys.intern(state.value): handler
+    for state, handler in {
+        AgentLifecycleState.ONBOARDED: _check_onboarded,
+        AgentLifecycleState.LICENSED: _check_licensed,
+        AgentLifecycleState.FIRST_SALE: _check_first_sale,
+        AgentLifecycleState.ACTIVE: _check_active,
+        AgentLifecycleState.PRODUCTIVE: _check_productive,
+        AgentLifecycleState.AT_RISK: _check_at_risk,
+        AgentLifecycleState.DORMANT: _check_dormant,
+        AgentLifecycleState.LAPSED: _check_lapsed,
+        AgentLifecycleState.TERMINATED: _check_terminated,
+    }.items()
 }
 
 
@@ -212,7 +230,7 @@ _STATE_HANDLERS: dict[str, callable] = {
 def compute_transition(
     current_state: str,
     signal_type: str,
-    payload: dict | None = None,
+    payload: Mapping[str, Any] | None = None,
     agent: AgentContext | None = None,
 ) -> str | None:
     """Determine if a signal triggers a lifecycle state transition.
@@ -230,17 +248,20 @@ def compute_transition(
     Returns:
         The new lifecycle state string, or None if no transition.
     """
-    payload = payload or {}
+    payload = payload if payload is not None else _EMPTY_PAYLOAD
     agent = agent or AgentContext()
 
-    # Check global transitions first (license expiry overrides everything)
-    new_state = _check_global(signal_type, payload, agent)
-    if new_state and new_state != current_state:
-        return new_state
+    # Global transition first: license expiry overrides every state
+    if (
+        signal_type == SignalType.LICENSE_STATUS_CHANGED
+        and payload.get("new_status") == "EXPIRED"
+        and current_state != AgentLifecycleState.LAPSED
+    ):
+        return AgentLifecycleState.LAPSED
 
     # Check state-specific handler
     handler = _STATE_HANDLERS.get(current_state)
-    if handler:
+    if handler is not None:
         new_state = handler(signal_type, payload, agent)
         if new_state and new_state != current_state:
             return new_state
@@ -252,6 +273,15 @@ def compute_transition(
 # Periodic Evaluation Helpers
 # ---------------------------------------------------------------------------
 
+# States whose agents can drift into AT_RISK / DORMANT on inactivity
+_ACTIVE_EVALUATION_STATES: frozenset[str] = frozenset({
+    AgentLifecycleState.ACTIVE,
+    AgentLifecycleState.PRODUCTIVE,
+    AgentLifecycleState.FIRST_SALE,
+    AgentLifecycleState.LICENSED,
+})
+
+
 def evaluate_risk_status(
     current_state: str,
     days_since_last_activity: int,
@@ -277,14 +307,7 @@ def evaluate_risk_status(
         New lifecycle state or None.
     """
     # Only evaluate active/productive/at_risk agents
-    active_states = {
-        AgentLifecycleState.ACTIVE,
-        AgentLifecycleState.PRODUCTIVE,
-        AgentLifecycleState.FIRST_SALE,
-        AgentLifecycleState.LICENSED,
-    }
-
-    if current_state in active_states:
+    if current_state in _ACTIVE_EVALUATION_STATES:
         if days_since_last_activity >= dormant_threshold_days:
             return AgentLifecycleState.DORMANT
         if (
@@ -300,80 +323,86 @@ def evaluate_risk_status(
     return None
 
 
+_LIFECYCLE_DISPLAY_INFO: dict[str, dict] = {
+    AgentLifecycleState.ONBOARDED: {
+        "label": "Onboarded",
+        "label_hi": "Naya Agent",
+        "color": "#3498db",
+        "emoji": "\U0001f195",
+        "description": "Recently joined, not yet licensed",
+    },
+    AgentLifecycleState.LICENSED: {
+        "label": "Licensed",
+        "label_hi": "License Mila",
+        "color": "#2ecc71",
+        "emoji": "\U0001f4cb",
+        "description": "Licensed but no sale yet",
+    },
+    AgentLifecycleState.FIRST_SALE: {
+        "label": "First Sale",
+        "label_hi": "Pehli Sale",
+        "color": "#27ae60",
+        "emoji": "\U0001f389",
+        "description": "Made their first policy sale",
+    },
+    AgentLifecycleState.ACTIVE: {
+        "label": "Active",
+        "label_hi": "Active",
+        "color": "#2ecc71",
+        "emoji": "\u2705",
+        "description": "Regularly selling policies",
+    },
+    AgentLifecycleState.PRODUCTIVE: {
+        "label": "Productive",
+        "label_hi": "Top Performer",
+        "color": "#f39c12",
+        "emoji": "\u2b50",
+        "description": "Consistently high performance",
+    },
+    AgentLifecycleState.AT_RISK: {
+        "label": "At Risk",
+        "label_hi": "Risk Mein",
+        "color": "#e67e22",
+        "emoji": "\u26a0\ufe0f",
+        "description": "Showing signs of disengagement",
+    },
+    AgentLifecycleState.DORMANT: {
+        "label": "Dormant",
+        "label_hi": "Dormant",
+        "color": "#e74c3c",
+        "emoji": "\U0001f534",
+        "description": "No activity for extended period",
+    },
+    AgentLifecycleState.LAPSED: {
+        "label": "Lapsed",
+        "label_hi": "License Expired",
+        "color": "#95a5a6",
+        "emoji": "\u23f0",
+        "description": "License expired",
+    },
+    AgentLifecycleState.TERMINATED: {
+        "label": "Terminated",
+        "label_hi": "Terminated",
+        "color": "#7f8c8d",
+        "emoji": "\u274c",
+        "description": "No longer active — terminal state",
+    },
+}
+
+
 def get_lifecycle_display_info(state: str) -> dict:
     """Return display metadata for a lifecycle state.
 
-    Useful for dashboards and Telegram bot formatting.
+    Useful for dashboards and Telegram bot formatting. Known states return
+    a shared dict (treat as read-only); copy it before modifying.
     """
-    display_map = {
-        AgentLifecycleState.ONBOARDED: {
-            "label": "Onboarded",
-            "label_hi": "Naya Agent",
-            "color": "#3498db",
-            "emoji": "\U0001f195",
-            "description": "Recently joined, not yet licensed",
-        },
-        AgentLifecycleState.LICENSED: {
-            "label": "Licensed",
-            "label_hi": "License Mila",
-            "color": "#2ecc71",
-            "emoji": "\U0001f4cb",
-            "description": "Licensed but no sale yet",
-        },
-        AgentLifecycleState.FIRST_SALE: {
-            "label": "First Sale",
-            "label_hi": "Pehli Sale",
-            "color": "#27ae60",
-            "emoji": "\U0001f389",
-            "description": "Made their first policy sale",
-        },
-        AgentLifecycleState.ACTIVE: {
-            "label": "Active",
-            "label_hi": "Active",
-            "color": "#2ecc71",
-            "emoji": "\u2705",
-            "description": "Regularly selling policies",
-        },
-        AgentLifecycleState.PRODUCTIVE: {
-            "label": "Productive",
-            "label_hi": "Top Performer",
-            "color": "#f39c12",
-            "emoji": "\u2b50",
-            "description": "Consistently high performance",
-        },
-        AgentLifecycleState.AT_RISK: {
-            "label": "At Risk",
-            "label_hi": "Risk Mein",
-            "color": "#e67e22",
-            "emoji": "\u26a0\ufe0f",
-            "description": "Showing signs of disengagement",
-        },
-        AgentLifecycleState.DORMANT: {
-            "label": "Dormant",
-            "label_hi": "Dormant",
-            "color": "#e74c3c",
-            "emoji": "\U0001f534",
-            "description": "No activity for extended period",
-        },
-        AgentLifecycleState.LAPSED: {
-            "label": "Lapsed",
-            "label_hi": "License Expired",
-            "color": "#95a5a6",
-            "emoji": "\u23f0",
-            "description": "License expired",
-        },
-        AgentLifecycleState.TERMINATED: {
-            "label": "Terminated",
-            "label_hi": "Terminated",
-            "color": "#7f8c8d",
-            "emoji": "\u274c",
-            "description": "No longer active — terminal state",
-        },
-    }
-    return display_map.get(state, {
+    info = _LIFECYCLE_DISPLAY_INFO.get(state)
+    if info is not None:
+        return info
+    return {
         "label": state.replace("_", " ").title(),
         "label_hi": state,
         "color": "#bdc3c7",
         "emoji": "\u2753",
         "description": "Unknown state",
-    })
+    }
@@ -12,10 +12,13 @@ The playbook engine provides:
 from __future__ import annotations
 
 import logging
+import operator
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from domain.enums import PlaybookActionType
 
@@ -28,16 +31,28 @@ logger = logging.getLogger(__name__)
 
 # Supported comparison operators
 _OPS = {
-    "==": lambda a, b: a == b,
-    "!=": lambda a, b: a != b,
-    ">": lambda a, b: _to_num(a) > _to_num(b),
-    "<": lambda a, b: _to_num(a) < _to_num(b),
-    ">=": lambda a, b: _to_num(a) >= _to_num(b),
-    "<=": lambda a, b: _to_num(a) <= _to_num(b),
+    "==": operator.eq,
+    "!=": operator.ne,
     "in": lambda a, b: a in b if isinstance(b, (list, tuple, set)) else str(a) in str(b),
     "contains": lambda a, b: b in a if isinstance(a, (list, tuple, set, str)) else False,
 }
 
+# Numeric comparisons: both sides go through _to_num first. For string
+# conditions the expected side is coerced once when the condition compiles.
+_NUMERIC_OPS = {
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+# op -> (function, numeric?) in one table, keyed by interned operator
+# strings, so each clause resolves its operator with a single lookup.
+_OP_TABLE: dict[str, tuple[Callable[[Any, Any], bool], bool]] = {
+    **{sys.intern(op): (func, False) for op, func in _OPS.items()},
+    **{sys.intern(op): (func, True) for op, func in _NUMERIC_OPS.items()},
+}
+
 # Regex to parse condition strings: "field op value" with optional AND joins
 _CONDITION_PATTERN = re.compile(
     r"(\w+(?:\.\w+)*)\s*(==|!=|>=|<=|>|<|in|contains)\s*(.+?)(?:\s+AND\s+|$)",
@@ -53,21 +68,30 @@ def _to_num(val: Any) -> float:
         return 0.0
 
 
+# Unsigned words float() accepts (signed forms start with + or -)
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+
 def _parse_value(raw: str) -> Any:
     """Parse a value string into a Python value."""
     raw = raw.strip().strip("'\"")
-    if raw.lower() == "true":
+    lowered = raw.lower()
+    if lowered == "true":
         return True
-    if raw.lower() == "false":
+    if lowered == "false":
         return False
-    try:
-        return int(raw)
-    except ValueError:
-        pass
-    try:
-        return float(raw)
-    except ValueError:
-        pass
+    # Only attempt numeric parsing when the value could be a number, so
+    # word values like "answered" don't raise (and catch) two ValueErrors.
+    first = raw[:1]
+    if first and (first in "+-." or first.isdigit() or lowered in _FLOAT_WORDS):
+        try:
+            return int(raw)
+        except ValueError:
+            pass
+        try:
+            return float(raw)
+        except ValueError:
+            pass
     # Check for list: [a, b, c]
     if raw.startswith("[") and raw.endswith("]"):
         items = [s.strip().strip("'\"") for s in raw[1:-1].split(",")]
@@ -75,9 +99,16 @@ def _parse_value(raw: str) -> Any:
     return raw
 
 
-def _get_nested(context: dict, key: str) -> Any:
-    """Get a value from context using dot notation (e.g., 'payload.outcome')."""
-    parts = key.split(".")
+@lru_cache(maxsize=256)
+def _field_parts(key: str) -> tuple[str, ...]:
+    """Split a dot-notation field name (e.g., 'payload.outcome') once."""
+    return tuple(key.split("."))
+
+
+def _get_nested(context: dict, parts: tuple[str, ...]) -> Any:
+    """Get a value from context by a pre-split dot-notation path."""
+    if len(parts) == 1:
+        return context.get(parts[0]) if isinstance(context, dict) else None
     current = context
     for part in parts:
         if isinstance(current, dict):
@@ -89,6 +120,59 @@ def _get_nested(context: dict, key: str) -> Any:
     return current
 
 
+def _compile_part(
+    field_name: str, op: str, raw_value: str,
+) -> tuple[tuple[str, ...], Callable[[Any, Any], bool] | None, Any, bool]:
+    """Compile one "field op value" clause into (path, op_func, expected, numeric)."""
+    expected = _parse_value(raw_value)
+    op_func, numeric = _OP_TABLE.get(op.lower(), (None, False))
+    if numeric:
+        expected = _to_num(expected)
+    return _field_parts(field_name), op_func, expected, numeric
+
+
+@lru_cache(maxsize=1024)
+def _compile_condition(
+    condition: str,
+) -> tuple[tuple[tuple[str, ...], Callable[[Any, Any], bool] | None, Any, bool], ...] | None:
+    """Parse a string condition once into (field path, op_func, expected, numeric) parts.
+
+    Playbook conditions are a small static set, so the regex scan and value
+    parsing are cached per condition string. Returns () for conditions
+    that always hold and None if the string cannot be parsed.
+    """
+    condition = condition.strip()
+    if condition.lower() == "default" or not condition:
+        return ()
+
+    matches = _CONDITION_PATTERN.findall(condition)
+    if not matches:
+        return None
+
+    return tuple(_compile_part(*match) for match in matches)
+
+
+def evaluate_dict_condition(condition: dict, context: dict) -> bool:
+    """Evaluate a dict-format condition, e.g. {"field": "quiz_score", "op": ">=", "value": 60}.
+
+    The shipped playbooks use this form exclusively, so resolve_next_step
+    calls it directly instead of going through evaluate_condition.
+    """
+    op = condition.get("op", "==")
+    actual = _get_nested(context, _field_parts(condition.get("field", "")))
+    entry = _OP_TABLE.get(op)
+    if entry is None:
+        logger.warning("Unknown operator '%s' in condition dict", op)
+        return False
+    op_func, numeric = entry
+    if numeric:
+        return op_func(_to_num(actual), _to_num(condition.get("value")))
+    try:
+        return op_func(actual, condition.get("value"))
+    except (TypeError, ValueError):
+        return False
+
+
 def evaluate_condition(condition: str | dict, context: dict) -> bool:
     """Evaluate a condition against a context dict.
 
@@ -105,35 +189,23 @@ def evaluate_condition(condition: str | dict, context: dict) -> bool:
     """
     # Handle dict-format conditions
     if isinstance(condition, dict):
-        field_name = condition.get("field", "")
-        op = condition.get("op", "==")
-        value = condition.get("value")
-        actual = _get_nested(context, field_name)
-        op_func = _OPS.get(op)
-        if op_func is None:
-            logger.warning("Unknown operator '%s' in condition dict", op)
-            return False
-        try:
-            return op_func(actual, value)
-        except (TypeError, ValueError):
-            return False
+        return evaluate_dict_condition(condition, context)
 
     # Handle string-format conditions
-    condition = str(condition).strip()
-    if condition.lower() == "default" or not condition:
-        return True
-
-    matches = _CONDITION_PATTERN.findall(condition)
-    if not matches:
-        logger.warning("Could not parse condition: %s", condition)
+    condition = str(condition)
+    parts = _compile_condition(condition)
+    if parts is None:
+        logger.warning("Could not parse condition: %s", condition.strip())
         return False
 
-    for field_name, op, raw_value in matches:
-        actual = _get_nested(context, field_name)
-        expected = _parse_value(raw_value)
-        op_func = _OPS.get(op.lower())
+    # Module globals bound once for the clause loop
+    get_nested, to_num = _get_nested, _to_num
+    for field_path, op_func, expected, numeric in parts:
+        actual = get_nested(context, field_path)
+        if numeric:
+            actual = to_num(actual)
         if op_func is None:
-            logger.warning("Unknown operator '%s' in condition: %s", op, condition)
+            logger.warning("Unknown operator in condition: %s", condition.strip())
             return False
         try:
             if not op_func(actual, expected):
@@ -154,9 +226,14 @@ def resolve_next_step(rules: list[dict], context: dict) -> dict | None:
 
     Returns the first matching rule dict, or None if no rules match.
     """
+    eval_dict, eval_any = evaluate_dict_condition, evaluate_condition
     for rule in rules:
         condition = rule.get("condition", "default")
-        if evaluate_condition(condition, context):
+        if type(condition) is dict:
+            matched = eval_dict(condition, context)
+        else:
+            matched = eval_any(condition, context)
+        if matched:
             return rule
     return None
 
@@ -165,7 +242,7 @@ def resolve_next_step(rules: list[dict], context: dict) -> dict | None:
 # PART 2: Playbook Step Execution
 # ===========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PlaybookStepResult:
     """Result of executing a single playbook step."""
     step_number: int
@@ -175,7 +252,42 @@ class PlaybookStepResult:
     message: str = ""
     next_step: int | None = None  # Override next step (from branching)
     route_to_playbook: str | None = None  # Route to different playbook
-    context_updates: dict = field(default_factory=dict)
+    # Created on first add_context(); most steps never write any (read as
+    # `result.context_updates or {}`)
+    context_updates: dict | None = None
+
+    def add_context(self, key: str, value: Any) -> None:
+        """Record a context update to carry into the next step."""
+        if self.context_updates is None:
+            self.context_updates = {}
+        self.context_updates[key] = value
+
+
+# "{key}" placeholders in step messages
+_PLACEHOLDER_PATTERN = re.compile(r"\{([^{}]*)\}")
+
+
+@lru_cache(maxsize=256)
+def _message_segments(message: str) -> tuple[str, ...]:
+    """Split a message template once into alternating literal / key segments."""
+    return tuple(_PLACEHOLDER_PATTERN.split(message))
+
+
+def _render_message(message: str, context: dict) -> str:
+    """Fill "{key}" placeholders from context in one pass.
+
+    Values are coerced with str() at substitution time, so numeric fields
+    such as {days_in_state} render too. Placeholders whose key is missing
+    or None are left as-is.
+    """
+    segments = _message_segments(message)
+    if len(segments) == 1:
+        return message
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        value = context.get(parts[i])
+        parts[i] = f"{{{parts[i]}}}" if value is None else str(value)
+    return "".join(parts)
 
 
 def execute_playbook_step(
@@ -204,9 +316,7 @@ def execute_playbook_step(
     # Generate the message from config, substituting variables from context
     message = action_config.get("message", "")
     if message and context:
-        for key, value in context.items():
-            if isinstance(value, str):
-                message = message.replace(f"{{{key}}}", value)
+        message = _render_message(message, context)
 
     result = PlaybookStepResult(
         step_number=step_number,
@@ -228,6 +338,34 @@ def execute_playbook_step(
     return result
 
 
+def _step_successors(steps: list[dict]) -> dict[Any, Any]:
+    """Map each step number to the one after it (None for the last step)."""
+    ordered = sorted(s.get("step_number", 0) for s in steps)
+    successors: dict[Any, Any] = {}
+    for idx, number in enumerate(ordered):
+        # First occurrence wins, matching list.index on the sorted list
+        if number not in successors:
+            successors[number] = ordered[idx + 1] if idx + 1 < len(ordered) else None
+    return successors
+
+
+@lru_cache(maxsize=1)
+def _default_step_tables() -> dict[int, tuple[list[dict], dict[Any, Any], frozenset]]:
+    """Successor maps and valid step numbers for the default playbooks.
+
+    Keyed by id() of each steps list. Each entry also holds its steps list, so
+    the id cannot be reused by another object while the table is alive.
+    """
+    return {
+        id(pb["steps"]): (
+            pb["steps"],
+            _step_successors(pb["steps"]),
+            frozenset(s.get("step_number") for s in pb["steps"]),
+        )
+        for pb in get_default_playbooks()
+    }
+
+
 def get_next_step_number(
     current_step: int,
     steps: list[dict],
@@ -243,41 +381,28 @@ def get_next_step_number(
     Returns:
         Next step number, or None if playbook is complete.
     """
+    # Default playbooks use their precomputed tables; edited copies are resolved here
+    entry = _default_step_tables().get(id(steps))
+
     if override_next is not None:
         # Validate the override step exists
-        if any(s.get("step_number") == override_next for s in steps):
+        if entry is not None:
+            if override_next in entry[2]:
+                return override_next
+        elif any(s.get("step_number") == override_next for s in steps):
             return override_next
 
-    # Default: move to next sequential step
-    step_numbers = sorted(s.get("step_number", 0) for s in steps)
-    try:
-        idx = step_numbers.index(current_step)
-        if idx + 1 < len(step_numbers):
-            return step_numbers[idx + 1]
-    except ValueError:
-        pass
-
-    return None  # Playbook complete
+    # Default: move to next sequential step (None once the playbook is complete)
+    successors = entry[1] if entry is not None else _step_successors(steps)
+    return successors.get(current_step)
 
 
 # ===========================================================================
 # PART 3: Default Playbook Definitions
 # ===========================================================================
 
-def get_default_playbooks() -> list[dict]:
-    """Return the six default playbook definitions.
-
-    These cover the major intervention scenarios:
-    1. New agent onboarding
-    2. Dormant agent reactivation (generic)
-    3. At-risk intervention
-    4. Commission concern resolution
-    5. System/process issue resolution
-    6. Training engagement
-
-    Each playbook has: name, description, trigger_conditions, success_criteria,
-    max_duration_days, and steps (list of step dicts with branching rules).
-    """
+def _build_default_playbooks() -> list[dict]:
+    """Build a fresh, fully mutable set of the default playbook definitions."""
     return [
         # -- 1. New Agent Onboarding --
         {
@@ -776,6 +901,43 @@ def get_default_playbooks() -> list[dict]:
     ]
 
 
+def _freeze_lists(value: Any) -> Any:
+    """Return value with every nested list replaced by a tuple."""
+    if isinstance(value, dict):
+        return {key: _freeze_lists(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_freeze_lists(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1)
+def get_default_playbooks() -> tuple[dict, ...]:
+    """Return the six default playbook definitions (shared, read-only).
+
+    These cover the major intervention scenarios:
+    1. New agent onboarding
+    2. Dormant agent reactivation (generic)
+    3. At-risk intervention
+    4. Commission concern resolution
+    5. System/process issue resolution
+    6. Training engagement
+
+    Each playbook has: name, description, trigger_conditions, success_criteria,
+    max_duration_days, and steps (tuple of step dicts with branching rules).
+
+    The definitions are built once per process and shared by every caller,
+    so all nested lists are frozen to tuples (they JSON-encode the same).
+    The dicts cannot be frozen without breaking JSON serialization: never
+    modify them. Use get_default_playbooks_mutable() for a private copy.
+    """
+    return tuple(_freeze_lists(pb) for pb in _build_default_playbooks())
+
+
+def get_default_playbooks_mutable() -> list[dict]:
+    """Return a freshly built list of the default playbooks that the caller may modify."""
+    return _build_default_playbooks()
+
+
 # ===========================================================================
 # PART 4: Playbook Selection
 # ===========================================================================
@@ -43,8 +43,9 @@ def _run_seed_if_empty():
         # Only reset if explicitly requested (never auto-reset on Neon)
         if os.environ.get("RESET_DB", "").lower() in ("true", "1", "yes"):
             logger.warning("RESET_DB=true — dropping and recreating all tables!")
-            from database import engine, Base
+            from database import get_engine, Base
             db.close()
+            engine = get_engine()
             Base.metadata.drop_all(bind=engine)
             Base.metadata.create_all(bind=engine)
             db = SessionLocal()